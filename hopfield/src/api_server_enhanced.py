@@ -3,13 +3,23 @@ Enhanced Flask server to expose the Hopfield algorithm as a REST API.
 Includes validation, logging, metrics, and error handling.
 """
 
+import io
+import json
 import logging
 import os
+import threading
 import time
 import traceback
-
-from flask import Flask, g, jsonify, request
-from hopfield_solver import solve_assignment_problem
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from flask import Flask, Response, g, jsonify, request
+from flask.json.provider import JSONProvider
+from hopfield_solver import (
+    batchable_size,
+    solve_assignment_problem,
+    solve_assignment_problems,
+)
 from logging_config import generate_request_id, setup_logging
 from metrics import metrics, track_request
 
@@ -19,11 +29,46 @@ from validation import (
     get_validation_summary,
     validate_batch_request,
     validate_cost_matrix,
+    validate_cost_matrix_array,
 )
 from werkzeug.exceptions import BadRequest
 
+try:
+    # Optional fast JSON parser (Rust implementation). Large cost
+    # matrices decode several times faster than with the stdlib parser.
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Responses built with jsonify() serialize through orjson's C
+    encoder, which is several times faster than the pure-Python
+    default on the dict/list payloads this API returns.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson rejects tokens like NaN and Infinity that the
+            # stdlib parser accepts; defer to it so such bodies still
+            # reach validation instead of failing as malformed JSON.
+            return json.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 # Setup structured logging
 log_level = os.getenv("LOG_LEVEL", "INFO")
@@ -32,6 +77,55 @@ setup_logging(level=log_level, use_json=use_json_logging)
 
 logger = logging.getLogger(__name__)
 
+# Worker pool for batch solves. Each solve is CPU-bound, so separate
+# processes give near-linear speedup with core count. Created lazily so
+# importing the module (e.g. in tests) does not spawn workers; the lock
+# keeps concurrent first requests from double-creating the pool and
+# leaking its worker processes.
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _solver_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                workers = int(os.getenv("SOLVER_WORKERS", os.cpu_count() or 1))
+                _POOL = ProcessPoolExecutor(max_workers=workers)
+    return _POOL
+
+
+def get_request_json():
+    """
+    Parse the request body, using orjson when available.
+
+    Returns None for an empty body and raises BadRequest for malformed
+    JSON, mirroring Flask's request.get_json() behavior.
+    """
+    if not ORJSON_AVAILABLE:
+        return request.get_json()
+
+    raw = request.get_data()
+    if not raw:
+        return None
+
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson is strict RFC 8259 and rejects tokens like NaN and
+        # Infinity that the stdlib parser accepts. Fall back to Flask's
+        # parser, which raises BadRequest for genuinely malformed JSON.
+        return request.get_json()
+
+
+def _json_line(obj) -> bytes:
+    """Serialize one NDJSON line, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode()
+
 
 @app.before_request
 def before_request():
@@ -133,7 +227,7 @@ def solve_assignment():
     }
     """
     try:
-        data = request.get_json()
+        data = get_request_json()
 
         if data is None:
             return (
@@ -187,7 +281,10 @@ def solve_assignment():
         )
 
         start_time = time.time()
-        result = solve_assignment_problem(cost_matrix)
+        # The input echo is opt-in via ?echo=1
+        result = solve_assignment_problem(
+            cost_matrix, include_input=request.args.get("echo") == "1"
+        )
         solve_duration = time.time() - start_time
 
         # Record solve metrics
@@ -238,6 +335,99 @@ def solve_assignment():
         )
 
 
+@app.route("/solve/bin", methods=["POST"])
+@track_request
+def solve_assignment_binary():
+    """
+    Solve an assignment problem posted as a NumPy .npy binary buffer.
+
+    The request body must be a single 2D array serialized with
+    np.save (float32 recommended). This skips JSON parsing and number
+    boxing entirely: the matrix arrives as a typed buffer and is
+    validated with vectorized checks.
+
+    Response: same JSON envelope as /solve.
+    """
+    try:
+        raw = request.get_data()
+
+        if not raw:
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "No binary payload in request body",
+                        "request_id": g.request_id,
+                    }
+                ),
+                400,
+            )
+
+        try:
+            matrix = np.load(io.BytesIO(raw), allow_pickle=False)
+        except (ValueError, OSError, EOFError) as e:
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": f"Body is not a valid .npy buffer: {e}",
+                        "request_id": g.request_id,
+                    }
+                ),
+                400,
+            )
+
+        try:
+            validate_cost_matrix_array(matrix)
+        except ValidationError as e:
+            logger.warning(
+                f"Validation error: {str(e)}",
+                extra={"request_id": g.request_id, "error": str(e)},
+            )
+            return (
+                jsonify(
+                    {"success": False, "error": str(e), "request_id": g.request_id}
+                ),
+                400,
+            )
+
+        # Store matrix size for metrics
+        n = matrix.shape[0]
+        g.matrix_size = n
+
+        logger.info(
+            f"Solving {n}x{n} assignment problem (binary payload)",
+            extra={"request_id": g.request_id, "matrix_size": n},
+        )
+
+        start_time = time.time()
+        result = solve_assignment_problem(matrix.astype(np.float64).tolist())
+        solve_duration = time.time() - start_time
+
+        # Record solve metrics
+        iterations = result.get("iterations", 0)
+        metrics.record_solve(iterations, n, solve_duration)
+
+        return jsonify({"success": True, "result": result, "request_id": g.request_id})
+
+    except Exception as e:
+        logger.error(
+            f"Error solving binary assignment problem: {str(e)}",
+            extra={"request_id": g.request_id, "traceback": traceback.format_exc()},
+        )
+
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": f"Internal server error: {str(e)}",
+                    "request_id": g.request_id,
+                }
+            ),
+            500,
+        )
+
+
 @app.route("/solve/batch", methods=["POST"])
 @track_request
 def solve_batch():
@@ -256,7 +446,7 @@ def solve_batch():
     }
     """
     try:
-        data = request.get_json()
+        data = get_request_json()
 
         if not data or "problems" not in data:
             return (
@@ -291,22 +481,59 @@ def solve_batch():
             extra={"request_id": g.request_id, "batch_size": len(problems)},
         )
 
-        results = []
+        # Validate on the request thread, then dispatch the CPU-bound
+        # solves to the worker pool, keeping input order. Validated
+        # same-size matrices are stacked into one contiguous (B, n, n)
+        # batch and solved with a single fused submission.
+        pool = _solver_pool()
+        entries = []
+        groups = {}
 
         for problem in problems:
-            problem_id = problem["id"]
+            entry = {"id": problem["id"], "error": None, "future": None}
+            entries.append(entry)
             cost_matrix = problem["cost_matrix"]
 
             try:
                 # Validate individual problem
                 validate_cost_matrix(cost_matrix)
+            except ValidationError as e:
+                entry["error"] = str(e)
+                continue
+
+            n = batchable_size(cost_matrix)
+            if n is None:
+                entry["future"] = pool.submit(solve_assignment_problem, cost_matrix)
+            else:
+                groups.setdefault(n, []).append((entry, cost_matrix))
+
+        for group in groups.values():
+            if len(group) == 1:
+                entry, cost_matrix = group[0]
+                entry["future"] = pool.submit(solve_assignment_problem, cost_matrix)
+                continue
+
+            future = pool.submit(
+                solve_assignment_problems, [matrix for _, matrix in group]
+            )
+            for slot, (entry, _) in enumerate(group):
+                entry["future"] = future
+                entry["slot"] = slot
 
-                # Solve the problem
-                result = solve_assignment_problem(cost_matrix)
-                results.append({"id": problem_id, "success": True, "result": result})
+        results = []
+        for entry in entries:
+            problem_id = entry["id"]
+            if entry["future"] is None:
+                results.append(
+                    {"id": problem_id, "success": False, "error": entry["error"]}
+                )
+                continue
 
-            except ValidationError as e:
-                results.append({"id": problem_id, "success": False, "error": str(e)})
+            try:
+                result = entry["future"].result()
+                if "slot" in entry:
+                    result = result[entry["slot"]]
+                results.append({"id": problem_id, "success": True, "result": result})
             except Exception as e:
                 logger.error(
                     f"Error solving problem {problem_id}: {str(e)}",
@@ -367,6 +594,127 @@ def solve_batch():
         )
 
 
+@app.route("/solve/batch/stream", methods=["POST"])
+@track_request
+def solve_batch_stream():
+    """
+    Solve a batch and stream results as NDJSON, one line per problem.
+
+    Same request body as /solve/batch. Each line is a standalone JSON
+    object {"id", "success", "result"|"error"}. Lines are emitted in
+    completion order as soon as each solve finishes, so the response
+    never buffers the whole batch and the first result arrives while
+    later problems are still being solved.
+    """
+    try:
+        data = get_request_json()
+
+        if not data or "problems" not in data:
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "Field 'problems' is required",
+                        "request_id": g.request_id,
+                    }
+                ),
+                400,
+            )
+
+        problems = data["problems"]
+
+        # Validate batch request
+        try:
+            validate_batch_request(problems)
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {"success": False, "error": str(e), "request_id": g.request_id}
+                ),
+                400,
+            )
+
+        # Record batch size
+        metrics.record_batch(len(problems))
+
+        logger.info(
+            f"Streaming batch of {len(problems)} problems",
+            extra={"request_id": g.request_id, "batch_size": len(problems)},
+        )
+
+        # Validate on the request thread; dispatch valid problems to
+        # the worker pool
+        pool = _solver_pool()
+        invalid = []
+        future_ids = {}
+
+        for problem in problems:
+            problem_id = problem["id"]
+            cost_matrix = problem["cost_matrix"]
+
+            try:
+                validate_cost_matrix(cost_matrix)
+            except ValidationError as e:
+                invalid.append((problem_id, str(e)))
+                continue
+
+            future_ids[pool.submit(solve_assignment_problem, cost_matrix)] = (
+                problem_id
+            )
+
+        def generate():
+            for problem_id, error in invalid:
+                yield _json_line(
+                    {"id": problem_id, "success": False, "error": error}
+                )
+
+            for future in as_completed(future_ids):
+                problem_id = future_ids[future]
+                try:
+                    yield _json_line(
+                        {
+                            "id": problem_id,
+                            "success": True,
+                            "result": future.result(),
+                        }
+                    )
+                except Exception as e:
+                    yield _json_line(
+                        {"id": problem_id, "success": False, "error": str(e)}
+                    )
+
+        return Response(generate(), mimetype="application/x-ndjson")
+
+    except BadRequest as e:
+        logger.error(f"Bad request: {str(e)}", extra={"request_id": g.request_id})
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": "Invalid JSON format",
+                    "request_id": g.request_id,
+                }
+            ),
+            400,
+        )
+
+    except Exception as e:
+        logger.error(
+            f"Error in streaming batch processing: {str(e)}",
+            extra={"request_id": g.request_id, "traceback": traceback.format_exc()},
+        )
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": f"Internal server error: {str(e)}",
+                    "request_id": g.request_id,
+                }
+            ),
+            500,
+        )
+
+
 if __name__ == "__main__":
     # Development mode
     logger.info("Starting Hopfield Assignment Solver API in development mode")
@@ -2,43 +2,69 @@
 Prometheus metrics collection for the Hopfield Assignment Solver.
 """
 
+import math
 import time
 from functools import wraps
 from typing import Dict
 
 
 class MetricsCollector:
-    """Simple in-memory metrics collector."""
+    """
+    Simple in-memory metrics collector.
+
+    Keeps running accumulators (count/sum/min/max) instead of raw
+    sample lists, so recording is O(1), get_metrics is O(1), and memory
+    stays bounded no matter how long the service runs.
+    """
 
     def __init__(self):
         self.request_count = 0
         self.error_count = 0
-        self.request_durations = []
-        self.solve_iterations = []
-        self.matrix_sizes = []
-        self.batch_sizes = []
+
+        self._duration_count = 0
+        self._duration_sum = 0.0
+        self._duration_min = math.inf
+        self._duration_max = -math.inf
+
+        self._iterations_count = 0
+        self._iterations_sum = 0
+
+        self._matrix_size_count = 0
+        self._matrix_size_sum = 0
+
+        self._batch_count = 0
+        self._batch_size_sum = 0
 
     def record_request(
         self, duration: float, status_code: int, matrix_size: int = None
     ):
         """Record a request."""
         self.request_count += 1
-        self.request_durations.append(duration)
+        self._duration_count += 1
+        self._duration_sum += duration
+        if duration < self._duration_min:
+            self._duration_min = duration
+        if duration > self._duration_max:
+            self._duration_max = duration
 
         if status_code >= 400:
             self.error_count += 1
 
         if matrix_size:
-            self.matrix_sizes.append(matrix_size)
+            self._matrix_size_count += 1
+            self._matrix_size_sum += matrix_size
 
     def record_solve(self, iterations: int, matrix_size: int, duration: float):
         """Record a solve operation."""
-        self.solve_iterations.append(iterations)
-        self.matrix_sizes.append(matrix_size)
+        self._iterations_count += 1
+        self._iterations_sum += iterations
+        self._matrix_size_count += 1
+        self._matrix_size_sum += matrix_size
 
     def record_batch(self, batch_size: int):
         """Record a batch operation."""
-        self.batch_sizes.append(batch_size)
+        self._batch_count += 1
+        self._batch_size_sum += batch_size
 
     def get_metrics(self) -> Dict:
         """Get current metrics."""
@@ -54,36 +80,36 @@ class MetricsCollector:
             },
             "performance": {
                 "avg_duration_ms": (
-                    sum(self.request_durations) / len(self.request_durations) * 1000
-                    if self.request_durations
+                    self._duration_sum / self._duration_count * 1000
+                    if self._duration_count
                     else 0
                 ),
                 "min_duration_ms": (
-                    min(self.request_durations) * 1000 if self.request_durations else 0
+                    self._duration_min * 1000 if self._duration_count else 0
                 ),
                 "max_duration_ms": (
-                    max(self.request_durations) * 1000 if self.request_durations else 0
+                    self._duration_max * 1000 if self._duration_count else 0
                 ),
             },
             "algorithm": {
                 "avg_iterations": (
-                    sum(self.solve_iterations) / len(self.solve_iterations)
-                    if self.solve_iterations
+                    self._iterations_sum / self._iterations_count
+                    if self._iterations_count
                     else 0
                 ),
                 "avg_matrix_size": (
-                    sum(self.matrix_sizes) / len(self.matrix_sizes)
-                    if self.matrix_sizes
+                    self._matrix_size_sum / self._matrix_size_count
+                    if self._matrix_size_count
                     else 0
                 ),
             },
             "batch": {
                 "avg_batch_size": (
-                    sum(self.batch_sizes) / len(self.batch_sizes)
-                    if self.batch_sizes
+                    self._batch_size_sum / self._batch_count
+                    if self._batch_count
                     else 0
                 ),
-                "total_batches": len(self.batch_sizes),
+                "total_batches": self._batch_count,
             },
         }
 
@@ -57,7 +57,7 @@ def validate_cost_matrix(cost_matrix: List[List[float]]) -> Tuple[bool, Optional
             f"Please reduce the matrix size or contact support for larger matrices."
         )
 
-    # Validate each row
+    # Structural checks stay in Python: O(n) and cheap
     for i, row in enumerate(cost_matrix):
         # Check if row is a list
         if not isinstance(row, list):
@@ -70,41 +70,146 @@ def validate_cost_matrix(cost_matrix: List[List[float]]) -> Tuple[bool, Optional
                 f"expected {n}. This is not a valid assignment problem."
             )
 
-        # Validate each cost value
-        for j, cost in enumerate(row):
-            # Check if cost is a number
-            if not isinstance(cost, (int, float)):
-                raise ValidationError(
-                    f"Cost at position [{i}][{j}] must be a number, "
-                    f"got {type(cost).__name__}: {cost}"
-                )
-
-            # Check for NaN or Inf
-            if not np.isfinite(cost):
-                if np.isnan(cost):
+    # Value checks run in one vectorized pass over the whole matrix.
+    # Locating the exact offending position only happens on the error
+    # (cold) path.
+    matrix = np.asarray(cost_matrix)
+
+    if (
+        matrix.ndim != 2
+        or not np.issubdtype(matrix.dtype, np.number)
+        or np.issubdtype(matrix.dtype, np.complexfloating)
+    ):
+        # Some element is not a plain number; find it for the message
+        for i, row in enumerate(cost_matrix):
+            for j, cost in enumerate(row):
+                if not isinstance(cost, (int, float)):
                     raise ValidationError(
-                        f"Cost at position [{i}][{j}] is NaN. "
-                        f"All costs must be valid numbers."
-                    )
-                else:
-                    raise ValidationError(
-                        f"Cost at position [{i}][{j}] is infinite. "
-                        f"All costs must be finite numbers."
+                        f"Cost at position [{i}][{j}] must be a number, "
+                        f"got {type(cost).__name__}: {cost}"
                     )
 
-            # Check cost value range
-            if cost < MIN_COST_VALUE:
-                raise ValidationError(
-                    f"Cost at position [{i}][{j}] is {cost}, which is negative. "
-                    f"All costs must be non-negative (>= {MIN_COST_VALUE})."
-                )
-
-            if cost > MAX_COST_VALUE:
-                raise ValidationError(
-                    f"Cost at position [{i}][{j}] is {cost}, which exceeds "
-                    f"maximum allowed value of {MAX_COST_VALUE}. "
-                    f"Please scale your costs down."
-                )
+        # Every element is an int or float, yet the array dtype is not
+        # plainly numeric: booleans (int subclasses to Python) or ints
+        # too large for int64 land here. Honor the per-element contract
+        # and run the value checks on a float64 view instead.
+        try:
+            matrix = np.asarray(cost_matrix, dtype=np.float64)
+        except OverflowError:
+            raise ValidationError(
+                f"Cost values are too large to represent. Maximum allowed "
+                f"value is {MAX_COST_VALUE}. Please scale your costs down."
+            )
+
+    if not np.isfinite(matrix).all():
+        nan_mask = np.isnan(matrix)
+        if nan_mask.any():
+            i, j = (int(k) for k in np.argwhere(nan_mask)[0])
+            raise ValidationError(
+                f"Cost at position [{i}][{j}] is NaN. "
+                f"All costs must be valid numbers."
+            )
+
+        i, j = (int(k) for k in np.argwhere(np.isinf(matrix))[0])
+        raise ValidationError(
+            f"Cost at position [{i}][{j}] is infinite. "
+            f"All costs must be finite numbers."
+        )
+
+    # All values are finite here, so min/max scans are safe and avoid
+    # allocating comparison masks on the hot path
+    if matrix.min() < MIN_COST_VALUE:
+        i, j = (int(k) for k in np.argwhere(matrix < MIN_COST_VALUE)[0])
+        raise ValidationError(
+            f"Cost at position [{i}][{j}] is {cost_matrix[i][j]}, which is "
+            f"negative. All costs must be non-negative (>= {MIN_COST_VALUE})."
+        )
+
+    if matrix.max() > MAX_COST_VALUE:
+        i, j = (int(k) for k in np.argwhere(matrix > MAX_COST_VALUE)[0])
+        raise ValidationError(
+            f"Cost at position [{i}][{j}] is {cost_matrix[i][j]}, which exceeds "
+            f"maximum allowed value of {MAX_COST_VALUE}. "
+            f"Please scale your costs down."
+        )
+
+    return True, None
+
+
+def validate_cost_matrix_array(matrix: np.ndarray) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a cost matrix supplied as a NumPy array.
+
+    Applies the same constraints as validate_cost_matrix, but checks
+    the whole array with vectorized reductions instead of per-element
+    Python loops.
+
+    Args:
+        matrix: The cost matrix to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+
+    Raises:
+        ValidationError: If validation fails with detailed error message
+    """
+    if matrix.ndim != 2:
+        raise ValidationError(
+            f"Cost matrix must be 2-dimensional, got {matrix.ndim} dimension(s)"
+        )
+
+    n, m = matrix.shape
+
+    if n == 0 or m == 0:
+        raise ValidationError("Cost matrix cannot be empty")
+
+    if n != m:
+        raise ValidationError(
+            f"Matrix must be square, got {n}x{m}. "
+            f"This is not a valid assignment problem."
+        )
+
+    if n < MIN_MATRIX_SIZE:
+        raise ValidationError(
+            f"Matrix size {n}x{n} is too small. "
+            f"Minimum size is {MIN_MATRIX_SIZE}x{MIN_MATRIX_SIZE}"
+        )
+
+    if n > MAX_MATRIX_SIZE:
+        raise ValidationError(
+            f"Matrix size {n}x{n} exceeds maximum allowed size of "
+            f"{MAX_MATRIX_SIZE}x{MAX_MATRIX_SIZE}. "
+            f"Please reduce the matrix size or contact support for larger matrices."
+        )
+
+    if not np.issubdtype(matrix.dtype, np.number) or np.issubdtype(
+        matrix.dtype, np.complexfloating
+    ):
+        raise ValidationError(
+            f"All costs must be real numbers, got dtype {matrix.dtype}"
+        )
+
+    if not np.isfinite(matrix).all():
+        if np.isnan(matrix).any():
+            raise ValidationError(
+                "Cost matrix contains NaN values. All costs must be valid numbers."
+            )
+        raise ValidationError(
+            "Cost matrix contains infinite values. "
+            "All costs must be finite numbers."
+        )
+
+    if matrix.min() < MIN_COST_VALUE:
+        raise ValidationError(
+            f"Cost matrix contains negative values. "
+            f"All costs must be non-negative (>= {MIN_COST_VALUE})."
+        )
+
+    if matrix.max() > MAX_COST_VALUE:
+        raise ValidationError(
+            f"Cost matrix contains values exceeding the maximum allowed "
+            f"value of {MAX_COST_VALUE}. Please scale your costs down."
+        )
 
     return True, None
 
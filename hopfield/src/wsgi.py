@@ -0,0 +1,12 @@
+"""
+WSGI entrypoint for production servers.
+
+Run with gunicorn, e.g.:
+
+    gunicorn -b 0.0.0.0:5000 -w 4 --worker-class gthread --threads 4 wsgi:app
+
+Threaded workers let request handling (JSON parsing, validation)
+overlap with solver compute, which releases the GIL inside BLAS.
+"""
+
+from api_server_enhanced import app  # noqa: F401
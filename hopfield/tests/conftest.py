@@ -0,0 +1,63 @@
+"""
+Shared pytest configuration for the Hopfield service tests.
+
+Puts the src/ directory on sys.path once, so individual test modules
+can import the service code directly without repeating the path hack.
+"""
+
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+# The clients are plain (not used as context managers): no test needs
+# the request context preserved after a call, and keeping contexts
+# alive across two interleaved long-lived clients corrupts Flask's
+# context stack.
+@pytest.fixture(scope='session')
+def client():
+    """Test client for the original Flask application."""
+    from api_server import app
+
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def enhanced_client():
+    """Test client for the enhanced Flask application."""
+    from api_server_enhanced import app
+
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def canonical_2x2_result():
+    """Solve the canonical [[1, 2], [3, 4]] smoke-test matrix once.
+
+    Several tests only inspect the result structure; sharing one solve
+    keeps them from redoing the same work per test.
+    """
+    from hopfield_solver import solve_assignment_problem
+
+    return solve_assignment_problem([[1, 2], [3, 4]])
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _silence_logs():
+    """Silence app and werkzeug logging for the test run.
+
+    Formatting and emitting a structured log record per request is pure
+    overhead while testing. Set TEST_LOG_LEVEL (e.g. to DEBUG) to get
+    the logs back when debugging a failure.
+    """
+    level = getattr(logging, os.getenv('TEST_LOG_LEVEL', 'CRITICAL').upper(),
+                    logging.CRITICAL)
+    logging.getLogger('werkzeug').setLevel(level)
+    logging.getLogger().setLevel(level)
+    yield
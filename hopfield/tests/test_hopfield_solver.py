@@ -1,14 +1,49 @@
 import pytest
 import numpy as np
-import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# src/ is on sys.path via conftest.py
 from hopfield_solver import HopfieldAssignmentSolver, solve_assignment_problem
 
 
+# Shared inputs for the unit tests below, allocated once and marked
+# read-only so accidental in-place mutation by the code under test
+# fails loudly instead of leaking between tests.
+_V = np.array([[0.1, 0.9, 0.2], [0.8, 0.1, 0.3], [0.2, 0.3, 0.7]])
+_V.setflags(write=False)
+_C3 = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float64)
+_C3.setflags(write=False)
+
+# A 25x25 instance above HOPFIELD_MIN_N, so convergence tests exercise
+# the actual relaxation rather than the small-n Hungarian shortcut.
+# Built from a fixed seed: the solver itself is deterministic, so the
+# quality bound below is stable.
+_C25 = np.random.default_rng(0).uniform(1.0, 100.0, size=(25, 25)).tolist()
+
+
+@pytest.fixture(scope="module")
+def oracle():
+    """Exact Hungarian reference cost, computed once per matrix."""
+    from scipy.optimize import linear_sum_assignment
+
+    def optimal_cost(matrix):
+        m = np.asarray(matrix, dtype=np.float64)
+        rows, cols = linear_sum_assignment(m)
+        return float(m[rows, cols].sum())
+
+    return optimal_cost
+
+
+@pytest.fixture(scope="module")
+def default_solver():
+    """One default-parameter solver shared by the tests below.
+
+    The solver is stateless between solve() calls (and solve() itself
+    is serialized with a lock), so constructing it once per module
+    avoids repeated init work.
+    """
+    return HopfieldAssignmentSolver()
+
+
 class TestHopfieldAssignmentSolver:
     def test_initialization(self):
         """Test that the solver initializes correctly."""
@@ -20,167 +55,138 @@ class TestHopfieldAssignmentSolver:
         assert solver.C == 200.0
         assert solver.D == 200.0
 
-    def test_activation_function(self):
+    def test_activation_function(self, default_solver):
         """Test the activation function behavior."""
-        solver = HopfieldAssignmentSolver()
-        
+        solver = default_solver
+
         # Test values
         assert solver._activation(0) == 0.5
         assert solver._activation(10) > 0.99
         assert solver._activation(-10) < 0.01
 
-    def test_solve_simple_2x2(self):
-        """Test solving a simple 2x2 assignment problem."""
-        cost_matrix = [
-            [1, 2],
-            [3, 4]
-        ]
-        
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should return valid assignments
-        assert len(assignments) == 2
-        assert all(isinstance(a, int) and a >= 0 for a in assignments)
-        assert total_cost >= 0
-        assert iterations > 0
-
-    def test_solve_3x3(self):
-        """Test solving a 3x3 assignment problem."""
-        cost_matrix = [
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 9]
-        ]
-        
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should return valid assignments
-        assert len(assignments) == 3
-        assert all(isinstance(a, int) and a >= 0 for a in assignments)
+    @pytest.mark.parametrize("cost_matrix,n", [
+        ([[1, 2], [3, 4]], 2),
+        ([[1, 2, 3], [4, 5, 6], [7, 8, 9]], 3),
+        ([[0, 0], [0, 0]], 2),
+        ([[1000, 2000], [3000, 4000]], 2),
+        ([[5]], 1),
+    ], ids=['2x2', '3x3', 'zeros', 'large-values', 'single'])
+    def test_solve_valid_matrices(self, default_solver, cost_matrix, n):
+        """A valid nxn matrix yields a complete assignment."""
+        assignments, total_cost, iterations = default_solver.solve(cost_matrix)
+
+        assert len(assignments) == n
+        assert all(isinstance(a, int) for a in assignments)
+        assert set(assignments) == set(range(n))
         assert total_cost >= 0
         assert iterations > 0
 
-    def test_solve_with_rectangular_matrix(self):
+    def test_solve_with_rectangular_matrix(self, default_solver):
         """Test that rectangular matrices raise ValueError."""
         cost_matrix = [
             [1, 2, 3],
             [4, 5, 6]
         ]
-        
-        solver = HopfieldAssignmentSolver()
-        
-        with pytest.raises(ValueError, match="Cost matrix must be square"):
-            solver.solve(cost_matrix)
-
-    def test_solve_with_zero_matrix(self):
-        """Test solving with zero cost matrix."""
-        cost_matrix = [
-            [0, 0],
-            [0, 0]
-        ]
-        
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should return valid assignments
-        assert len(assignments) == 2
-        assert all(isinstance(a, int) and a >= 0 for a in assignments)
-        assert total_cost >= 0
-        assert iterations > 0
 
-    def test_solve_with_large_values(self):
-        """Test solving with large cost values."""
-        cost_matrix = [
-            [1000, 2000],
-            [3000, 4000]
-        ]
-        
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should return valid assignments
-        assert len(assignments) == 2
-        assert all(isinstance(a, int) and a >= 0 for a in assignments)
-        assert total_cost >= 0
-        assert iterations > 0
+        with pytest.raises(ValueError, match="Cost matrix must be square"):
+            default_solver.solve(cost_matrix)
 
-    def test_solve_with_negative_values(self):
+    def test_solve_with_negative_values(self, default_solver):
         """Test solving with negative cost values."""
         cost_matrix = [
             [-1, -2],
             [-3, -4]
         ]
         
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
+        assignments, total_cost, iterations = default_solver.solve(cost_matrix)
         
         # Should return valid assignments
         assert len(assignments) == 2
         assert all(isinstance(a, int) and a >= 0 for a in assignments)
         assert iterations > 0
 
-    def test_solve_with_single_element(self):
-        """Test solving with single element matrix."""
-        cost_matrix = [[5]]
-        
-        solver = HopfieldAssignmentSolver()
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should return valid assignments
-        assert len(assignments) == 1
-        assert isinstance(assignments[0], int)
-        assert assignments[0] >= 0
-        assert total_cost >= 0
-        assert iterations > 0
-
-    def test_solve_with_invalid_input(self):
+    def test_solve_with_invalid_input(self, default_solver):
         """Test handling of invalid input."""
-        solver = HopfieldAssignmentSolver()
-        
         # Test empty matrix
         with pytest.raises(ValueError):
-            solver.solve([])
-        
+            default_solver.solve([])
+
         # Test matrix with empty rows
         with pytest.raises(ValueError):
-            solver.solve([[]])
+            default_solver.solve([[]])
+
+    def test_discretize_assignments(self, default_solver):
+        """Discretizing clear activations picks the dominant entries."""
+        assignments = default_solver._discretize_assignments(_V)
+
+        assert list(assignments) == [1, 0, 2]
+
+    def test_calculate_total_cost(self, default_solver):
+        """Total cost sums each worker's assigned cost."""
+        total = default_solver._calculate_total_cost([1, 0, 2], _C3)
+
+        assert total == 2 + 4 + 9
 
-    def test_convergence_properties(self):
+    def test_solve_many_quality_above_min_n(self, default_solver, oracle):
+        """Fused batch solves above HOPFIELD_MIN_N must meet the same
+        quality bound as individual solves; small batches take the
+        Hungarian shortcut and never run the batched iteration."""
+        matrices = np.random.default_rng(1).uniform(1.0, 100.0, size=(3, 25, 25))
+
+        results = default_solver.solve_many(matrices)
+
+        for matrix, (assignments, total_cost, iterations) in zip(matrices, results):
+            assert set(assignments) == set(range(25))
+            assert iterations > 0
+            optimal = oracle(matrix)
+            assert optimal <= total_cost <= 3.0 * optimal
+
+    def test_solve_is_deterministic(self, default_solver):
+        """The warm start is derived from the costs, not an RNG, so
+        repeated solves of the same matrix are bit-identical."""
+        cost_matrix = [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]]
+
+        first = default_solver.solve(cost_matrix)
+        second = default_solver.solve(cost_matrix)
+
+        assert first == second
+
+    @pytest.mark.parametrize("cost_matrix", [
+        [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+        _C25,
+    ], ids=['3x3', '25x25'])
+    def test_convergence_properties(self, default_solver, oracle, cost_matrix):
         """Test that the solver converges to reasonable solutions."""
-        cost_matrix = [
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 9]
-        ]
-        
-        solver = HopfieldAssignmentSolver(max_iterations=500)
-        assignments, total_cost, iterations = solver.solve(cost_matrix)
-        
-        # Should converge within reasonable iterations
-        assert iterations <= 500
-        assert len(assignments) == 3
-        assert all(isinstance(a, int) and a >= 0 for a in assignments)
-        assert total_cost >= 0
+        n = len(cost_matrix)
+
+        assignments, total_cost, iterations = default_solver.solve(cost_matrix)
 
-def test_solve_assignment_problem():
+        # Checked against the exact Hungarian cost from both sides: a
+        # valid permutation can never beat the optimum, and the
+        # relaxation must land well inside 3x of it (measured quality
+        # is ~1.5-1.9x on random instances; a broken iteration decodes
+        # near-random assignments at ~6x and fails this)
+        assert iterations <= default_solver.max_iterations
+        assert set(assignments) == set(range(n))
+        optimal = oracle(cost_matrix)
+        assert optimal <= total_cost <= 3.0 * optimal
+
+def test_solve_assignment_problem(canonical_2x2_result):
     """Test the convenience function."""
-    cost_matrix = [
-        [1, 2],
-        [3, 4]
-    ]
-    
-    result = solve_assignment_problem(cost_matrix)
-    
+    result = canonical_2x2_result
+
     assert "assignments" in result
     assert "total_cost" in result
     assert "iterations" in result
-    assert "cost_matrix" in result
+    # The input echo is opt-in
+    assert "cost_matrix" not in result
     
     assert len(result["assignments"]) == 2
     assert isinstance(result["total_cost"], float)
     assert isinstance(result["iterations"], int)
+
+    cost_matrix = [[1, 2], [3, 4]]
+    result = solve_assignment_problem(cost_matrix, include_input=True)
     assert result["cost_matrix"] == cost_matrix
 
 def test_solve_assignment_problem_with_rectangular():
@@ -3,12 +3,8 @@ Tests for the validation module.
 """
 
 import pytest
-import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# src/ is on sys.path via conftest.py
 from validation import (
     validate_cost_matrix,
     validate_batch_request,
@@ -16,97 +12,79 @@ from validation import (
     get_validation_summary
 )
 
+# Valid matrices shared across tests, built once at import. Validation
+# never mutates its input, so reuse (including aliasing one 2x2 object
+# across all 101 problems of the oversize batch) is safe.
+_TEMPLATE_2X2 = [[1, 2], [3, 4]]
+_MATRIX_5X5 = [[i * 5 + j for j in range(5)] for i in range(5)]
+
+# Invalid matrices paired with the error-message fragment each must
+# produce. The oversize case is a factory so the 51x51 list is only
+# built when that parameter actually runs.
+INVALID_MATRICES = [
+    ([], 'empty'),
+    ([[1]], 'too small'),
+    (lambda: [[1] * 51 for _ in range(51)], '50'),
+    ([[1, 2, 3], [4, 5, 6]], 'square'),
+    ([[float('nan'), 2], [3, 4]], 'NaN'),
+    ([[float('inf'), 2], [3, 4]], 'infinite'),
+    ([[-1, 2], [3, 4]], 'negative'),
+    ([[1e10, 2], [3, 4]], 'exceeds'),
+    ([[1, 2], "invalid"], 'must be a list'),
+    ([['a', 2], [3, 4]], 'must be a number'),
+    ("not a list", 'must be a list'),
+]
+
+# Invalid batch requests paired with the error-message fragment each
+# must produce. The 101-problem batch is a factory so it is only built
+# when that case runs.
+INVALID_BATCHES = [
+    ([], 'empty'),
+    ("not a list", 'must be a list'),
+    (lambda: [{'id': f'p{i}', 'cost_matrix': _TEMPLATE_2X2}
+              for i in range(101)], '100'),
+    ([{'cost_matrix': [[1, 2], [3, 4]]}], 'id'),
+    ([{'id': 'p1'}], 'cost_matrix'),
+    (['not a dict'], 'dictionary'),
+]
+
 
 class TestValidateCostMatrix:
     """Tests for cost matrix validation."""
     
     def test_valid_2x2_matrix(self):
         """Test with valid 2x2 matrix."""
-        cost_matrix = [[1, 2], [3, 4]]
-        is_valid, error = validate_cost_matrix(cost_matrix)
+        is_valid, error = validate_cost_matrix(_TEMPLATE_2X2)
         assert is_valid is True
         assert error is None
     
     def test_valid_5x5_matrix(self):
         """Test with valid 5x5 matrix."""
-        cost_matrix = [[i*5+j for j in range(5)] for i in range(5)]
-        is_valid, error = validate_cost_matrix(cost_matrix)
+        is_valid, error = validate_cost_matrix(_MATRIX_5X5)
         assert is_valid is True
-    
-    def test_empty_matrix(self):
-        """Test with empty matrix."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix([])
-        assert 'empty' in str(exc_info.value).lower()
-    
-    def test_matrix_too_large(self):
-        """Test with matrix exceeding maximum size."""
-        cost_matrix = [[1] * 51 for _ in range(51)]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert '50' in str(exc_info.value)
-    
-    def test_matrix_too_small(self):
-        """Test with 1x1 matrix."""
-        cost_matrix = [[1]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'too small' in str(exc_info.value).lower()
-    
-    def test_non_square_matrix(self):
-        """Test with non-square matrix."""
-        cost_matrix = [[1, 2, 3], [4, 5, 6]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'square' in str(exc_info.value).lower()
-    
-    def test_nan_value(self):
-        """Test with NaN value."""
-        cost_matrix = [[float('nan'), 2], [3, 4]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'NaN' in str(exc_info.value)
-    
-    def test_inf_value(self):
-        """Test with infinite value."""
-        cost_matrix = [[float('inf'), 2], [3, 4]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'infinite' in str(exc_info.value).lower()
-    
-    def test_negative_cost(self):
-        """Test with negative cost."""
-        cost_matrix = [[-1, 2], [3, 4]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'negative' in str(exc_info.value).lower()
-    
-    def test_cost_too_large(self):
-        """Test with cost exceeding maximum value."""
-        cost_matrix = [[1e10, 2], [3, 4]]  # Exceeds MAX_COST_VALUE (1e9)
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'exceeds' in str(exc_info.value).lower()
-    
-    def test_invalid_row_type(self):
-        """Test with invalid row type."""
-        cost_matrix = [[1, 2], "invalid"]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'must be a list' in str(exc_info.value).lower()
-    
-    def test_invalid_cost_type(self):
-        """Test with invalid cost value type."""
-        cost_matrix = [['a', 2], [3, 4]]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix(cost_matrix)
-        assert 'must be a number' in str(exc_info.value).lower()
-    
-    def test_non_list_matrix(self):
-        """Test with non-list matrix."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_cost_matrix("not a list")
-        assert 'must be a list' in str(exc_info.value).lower()
+
+    def test_valid_boolean_matrix(self):
+        """Booleans are ints to Python and count as valid 0/1 costs."""
+        is_valid, error = validate_cost_matrix([[True, False], [False, True]])
+        assert is_valid is True
+
+    def test_oversized_int_cost(self):
+        """Ints beyond float64 range fail with the cost-range message."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_cost_matrix([[10 ** 400, 2], [3, 4]])
+        assert 'too large' in str(exc_info.value)
+    
+    @pytest.mark.parametrize("matrix,needle", INVALID_MATRICES, ids=[
+        'empty', 'too-small', 'too-large', 'non-square', 'nan', 'inf',
+        'negative', 'cost-too-large', 'bad-row', 'bad-cost', 'non-list',
+    ])
+    def test_invalid_matrix(self, matrix, needle):
+        """Invalid matrices raise with a descriptive message."""
+        if callable(matrix):
+            matrix = matrix()
+        with pytest.raises(ValidationError) as exc_info:
+            validate_cost_matrix(matrix)
+        assert needle in str(exc_info.value)
 
 
 class TestValidateBatchRequest:
@@ -121,84 +99,47 @@ class TestValidateBatchRequest:
         is_valid, error = validate_batch_request(problems)
         assert is_valid is True
     
-    def test_empty_batch(self):
-        """Test with empty problems list."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_batch_request([])
-        assert 'empty' in str(exc_info.value).lower()
-    
-    def test_batch_too_large(self):
-        """Test with batch exceeding maximum size."""
-        problems = [
-            {'id': f'p{i}', 'cost_matrix': [[1, 2], [3, 4]]}
-            for i in range(101)
-        ]
+    @pytest.mark.parametrize("problems,needle", INVALID_BATCHES, ids=[
+        'empty', 'non-list', 'too-large', 'missing-id',
+        'missing-cost-matrix', 'non-dict-problem',
+    ])
+    def test_invalid_batch(self, problems, needle):
+        """Invalid batch requests raise with a descriptive message."""
+        if callable(problems):
+            problems = problems()
         with pytest.raises(ValidationError) as exc_info:
             validate_batch_request(problems)
-        assert '100' in str(exc_info.value)
-    
-    def test_non_list_batch(self):
-        """Test with non-list batch."""
-        with pytest.raises(ValidationError) as exc_info:
-            validate_batch_request("not a list")
-        assert 'must be a list' in str(exc_info.value).lower()
-    
-    def test_missing_id(self):
-        """Test with problem missing ID."""
-        problems = [
-            {'cost_matrix': [[1, 2], [3, 4]]}
-        ]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_batch_request(problems)
-        assert 'id' in str(exc_info.value).lower()
-    
-    def test_missing_cost_matrix(self):
-        """Test with problem missing cost_matrix."""
-        problems = [
-            {'id': 'p1'}
-        ]
-        with pytest.raises(ValidationError) as exc_info:
-            validate_batch_request(problems)
-        assert 'cost_matrix' in str(exc_info.value).lower()
-    
-    def test_invalid_problem_type(self):
-        """Test with non-dict problem."""
-        problems = ['not a dict']
-        with pytest.raises(ValidationError) as exc_info:
-            validate_batch_request(problems)
-        assert 'dictionary' in str(exc_info.value).lower()
+        assert needle in str(exc_info.value)
+
+
+@pytest.fixture(scope="module")
+def summary():
+    """The validation summary is constant; build it once per module."""
+    return get_validation_summary()
 
 
 class TestGetValidationSummary:
     """Tests for get_validation_summary function."""
-    
-    def test_validation_summary_structure(self):
+
+    def test_validation_summary_structure(self, summary):
         """Test that validation summary has correct structure."""
-        summary = get_validation_summary()
-        
         assert 'matrix_size' in summary
         assert 'cost_value' in summary
         assert 'batch_size' in summary
         assert 'request_size_mb' in summary
-    
-    def test_matrix_size_constraints(self):
+
+    def test_matrix_size_constraints(self, summary):
         """Test matrix size constraints in summary."""
-        summary = get_validation_summary()
-        
         assert summary['matrix_size']['min'] == 2
         assert summary['matrix_size']['max'] == 50
-    
-    def test_cost_value_constraints(self):
+
+    def test_cost_value_constraints(self, summary):
         """Test cost value constraints in summary."""
-        summary = get_validation_summary()
-        
         assert summary['cost_value']['min'] == 0
         assert summary['cost_value']['max'] == 1e9
-    
-    def test_batch_size_constraint(self):
+
+    def test_batch_size_constraint(self, summary):
         """Test batch size constraint in summary."""
-        summary = get_validation_summary()
-        
         assert summary['batch_size']['max'] == 100
 
 